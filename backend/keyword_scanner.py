@@ -0,0 +1,146 @@
+"""
+keyword_scanner.py
+------------------
+Single-pass multi-keyword scanning for the offline skill fallbacks.
+
+Single-word keywords are answered from one tokenisation of the text; multi-word
+and punctuated keywords are compiled once into an Aho-Corasick automaton, so a
+document is walked a single time no matter how many keywords are registered.
+"""
+
+import logging
+import re
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# pyahocorasick optional import — falls back to one precompiled regex alternation when missing
+try:
+    import ahocorasick
+    _AC_AVAILABLE = True
+except Exception:
+    _AC_AVAILABLE = False
+
+
+# Letter/digit neighbours, matching the str.isalnum() rule used by _is_boundary
+_ALNUM_BEFORE = r"(?<![^\W_])"
+_ALNUM_AFTER = r"(?![^\W_])"
+
+# Maximal letter/digit runs — the tokens a plain alphanumeric keyword can be
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+V = TypeVar("V", bound=Hashable)
+
+
+def _is_boundary(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not glued to a letter or digit on either side."""
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    if end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+class KeywordScanner(Generic[V]):
+    def __init__(self, keywords: Dict[str, V]):
+        """
+        keywords maps each lowercase variant to the value reported when it is found,
+        e.g. {"k8s": "kubernetes", "kubernetes": "kubernetes"}. Any hashable value works.
+        """
+        self._keywords = {k.lower().strip(): v for k, v in keywords.items() if k and k.strip()}
+        # Output follows registration order so results are stable across scan strategies
+        self._order = {value: i for i, value in enumerate(dict.fromkeys(self._keywords.values()))}
+
+        # Plain alphanumeric variants ("python", "k8s") are whole tokens — a set lookup finds them.
+        # Only variants with spaces or punctuation ("node.js", "ci/cd", "patient care") need a text scan.
+        self._single_words = {k: v for k, v in self._keywords.items() if k.isalnum()}
+        phrases = {k: v for k, v in self._keywords.items() if not k.isalnum()}
+
+        self._automaton = None
+        self._pattern: Optional[re.Pattern] = None
+        self._prefixes: Dict[str, List[str]] = {}
+        if not phrases:
+            return
+        if _AC_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for variant, value in phrases.items():
+                automaton.add_word(variant, (len(variant), value))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            logger.info(f"pyahocorasick not installed — scanning {len(phrases)} phrases with a regex alternation")
+            # Zero-width lookahead so overlapping phrases are all seen, as with the automaton.
+            # Longest-first: each start position reports its longest whole-word phrase...
+            variants = sorted(phrases, key=len, reverse=True)
+            self._pattern = re.compile(
+                _ALNUM_BEFORE + "(?=(" + "|".join(map(re.escape, variants)) + ")" + _ALNUM_AFTER + ")"
+            )
+            # ...and any shorter phrase starting there is a prefix of it ("asp.net" of "asp.net core")
+            for variant in variants:
+                prefixes = [variant[:i] for i in range(1, len(variant)) if variant[:i] in phrases]
+                if prefixes:
+                    self._prefixes[variant] = prefixes
+
+    def _regex_hits(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """(start, end, variant) for every phrase occurrence found by the regex fallback, overlaps included."""
+        for m in self._pattern.finditer(text):
+            start = m.start()
+            variant = m.group(1)
+            yield start, start + len(variant), variant
+            for prefix in self._prefixes.get(variant, ()):
+                if _is_boundary(text, start, start + len(prefix)):
+                    yield start, start + len(prefix), prefix
+
+    def scan(self, text: str) -> List[V]:
+        """
+        Return the value of every keyword that appears in text as a whole word.
+        Case-insensitive, de-duplicated, in keyword registration order.
+        """
+        found: Set[V] = set()
+        # One lowercase copy feeds every strategy — keys are stored lowercase
+        text = text.lower()
+
+        if self._automaton is not None:
+            for end, (length, value) in self._automaton.iter(text):
+                if _is_boundary(text, end - length + 1, end + 1):
+                    found.add(value)
+        elif self._pattern is not None:
+            for _, _, variant in self._regex_hits(text):
+                value = self._keywords.get(variant)
+                if value is not None:
+                    found.add(value)
+
+        if self._single_words:
+            tokens = set(_WORD_RE.findall(text))
+            found.update(self._single_words[t] for t in tokens & self._single_words.keys())
+
+        return sorted(found, key=self._order.__getitem__)
+
+    def scan_spans(self, text: str) -> List[Tuple[int, int, V]]:
+        """
+        Return (start, end, value) for every whole-word keyword occurrence, ordered by position.
+        Offsets index text.lower() — the same positions as text for all but a few exotic code points.
+        """
+        spans: List[Tuple[int, int, V]] = []
+        text = text.lower()
+
+        if self._automaton is not None:
+            for end, (length, value) in self._automaton.iter(text):
+                start = end - length + 1
+                if _is_boundary(text, start, end + 1):
+                    spans.append((start, end + 1, value))
+        elif self._pattern is not None:
+            for start, end, variant in self._regex_hits(text):
+                value = self._keywords.get(variant)
+                if value is not None:
+                    spans.append((start, end, value))
+
+        if self._single_words:
+            for m in _WORD_RE.finditer(text):
+                value = self._single_words.get(m.group())
+                if value is not None:
+                    spans.append((m.start(), m.end(), value))
+
+        spans.sort(key=lambda span: span[:2])
+        return spans
@@ -1,23 +1,28 @@
 import os
-import io
-import json
 import logging
-import re
 import asyncio
-from typing import List, Dict, Set, Optional
-
-import PyPDF2
+import functools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Dict, Set, Optional
+
+import httpx
+import orjson
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 import groq as groq_module
-from groq import Groq
+from groq import AsyncGroq
 from dotenv import load_dotenv
 
 from skill_extractor import SkillExtractor
 from semantic_matcher import SemanticMatcher
+import pdf_extractor
 
 # ============================================================================
 # CONFIGURATION
@@ -26,7 +31,19 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Smart Resume Matcher API", version="14.0.0")
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (FastAPI's own ORJSONResponse is deprecated in newer releases)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Smart Resume Matcher API",
+    version="14.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Middleware
 app.add_middleware(GZipMiddleware, minimum_size=1000)
@@ -53,9 +70,11 @@ app.add_middleware(
 )
 
 # Global singletons — initialised on startup
-groq_client: Optional[Groq] = None
+groq_client: Optional[AsyncGroq] = None
+groq_http: Optional[httpx.AsyncClient] = None
 skill_extractor: Optional[SkillExtractor] = None
 semantic_matcher: Optional[SemanticMatcher] = None
+pdf_pool: Optional[ProcessPoolExecutor] = None
 
 
 # ============================================================================
@@ -63,11 +82,19 @@ semantic_matcher: Optional[SemanticMatcher] = None
 # ============================================================================
 @app.on_event("startup")
 async def startup_event():
-    global groq_client, skill_extractor, semantic_matcher
+    global groq_client, groq_http, skill_extractor, semantic_matcher, pdf_pool
+
+    # PDF parsing is CPU-bound and GIL-heavy — run it in worker processes
+    pdf_pool = _new_pdf_pool()
 
     api_key = os.getenv("GROQ_API_KEY")
     if api_key:
-        groq_client = Groq(api_key=api_key)
+        # One pooled HTTP/2 client for every Groq call — TLS handshakes are paid once, not per request
+        groq_http = groq_module.DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        groq_client = AsyncGroq(api_key=api_key, http_client=groq_http)
         logger.info("✅ Groq AI initialised")
     else:
         logger.warning("⚠️  No Groq API key — running without AI narrative")
@@ -84,6 +111,44 @@ async def startup_event():
             logger.error(f"SemanticMatcher init failed: {e}")
 
     await asyncio.to_thread(_load_nlp)
+    await _warm_up()
+
+
+async def _warm_up() -> None:
+    """Pay one-off costs here rather than on the first request — each step logs its duration."""
+    loop = asyncio.get_running_loop()
+
+    # Spawned workers start lazily and import pypdfium2 on their first task. Warm one so the
+    # first upload skips the spawn; the rest start on demand instead of all holding memory at boot.
+    t0 = time.perf_counter()
+    pool = pdf_pool
+    try:
+        await loop.run_in_executor(pool, pdf_extractor.warm_up)
+        logger.info(f"🔥 PDF worker ready in {time.perf_counter() - t0:.2f}s (pool of {_PDF_WORKERS})")
+    except BrokenProcessPool as e:
+        # Optional optimisation — start anyway with a fresh pool; workers spawn on first upload
+        logger.warning(f"PDF warm-up skipped: {e}")
+        await _replace_broken_pdf_pool(pool)
+    except Exception as e:
+        logger.warning(f"PDF warm-up skipped: {e}")
+
+    # Open the pooled HTTP/2 connection — listing models costs no tokens
+    if groq_client:
+        t0 = time.perf_counter()
+        try:
+            # Bounded, no retries — an unreachable API must not hold up startup
+            await groq_client.with_options(max_retries=0, timeout=5.0).models.list()
+            logger.info(f"🔥 Groq connection warmed in {time.perf_counter() - t0:.2f}s")
+        except Exception as e:
+            logger.warning(f"Groq warm-up skipped: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if groq_http:
+        await groq_http.aclose()
+    if pdf_pool:
+        pdf_pool.shutdown(wait=False, cancel_futures=True)
 
 
 # ============================================================================
@@ -97,6 +162,7 @@ async def root():
         "status": "running",
         "endpoints": {
             "calculate_match": "POST /api/calculate-match",
+            "calculate_match_batch": "POST /api/calculate-match-batch",
             "health": "GET /health",
         },
         "docs": "/docs",
@@ -116,16 +182,72 @@ async def health_check():
 # ============================================================================
 # PDF EXTRACTION
 # ============================================================================
-def extract_text_from_pdf(file_content: bytes) -> str:
+_MAX_PDF_BYTES = int(os.getenv("MAX_PDF_BYTES", str(5 * 1024 * 1024)))
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+async def read_pdf_upload(file: UploadFile) -> bytes:
+    """Read an uploaded PDF in chunks, rejecting it with 413 as soon as it exceeds _MAX_PDF_BYTES."""
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Resume PDF exceeds the {_MAX_PDF_BYTES / (1024 * 1024):.3g} MB limit",
+    )
+    if file.size is not None and file.size > _MAX_PDF_BYTES:
+        raise too_large
+
+    buffer = bytearray()
+    while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+        buffer += chunk
+        if len(buffer) > _MAX_PDF_BYTES:
+            raise too_large
+    return bytes(buffer)
+
+
+def _pdf_worker_count() -> int:
+    """CPUs this process may run on (not the host total), capped by PDF_WORKERS."""
     try:
-        reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
-        return " ".join(text.split())
-    except Exception as e:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, int(os.getenv("PDF_WORKERS", "2"))))
+
+
+_PDF_WORKERS = _pdf_worker_count()
+_pdf_pool_lock = asyncio.Lock()
+
+
+def _new_pdf_pool() -> ProcessPoolExecutor:
+    # "spawn" keeps workers from inheriting the event loop and client threads
+    return ProcessPoolExecutor(
+        max_workers=_PDF_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+async def _replace_broken_pdf_pool(broken: ProcessPoolExecutor) -> None:
+    """Swap in a fresh pool once — concurrent requests that saw the same broken pool reuse the new one."""
+    global pdf_pool
+    async with _pdf_pool_lock:
+        if pdf_pool is broken:
+            pdf_pool = _new_pdf_pool()
+            broken.shutdown(wait=False, cancel_futures=True)
+            logger.warning("♻️  PDF worker pool restarted")
+
+
+async def extract_text_from_pdf(file_content: bytes) -> str:
+    """Parse the PDF in the worker pool so the event loop keeps serving other requests."""
+    loop = asyncio.get_running_loop()
+    pool = pdf_pool
+    try:
+        return await loop.run_in_executor(pool, pdf_extractor.extract_text, file_content)
+    except ValueError as e:
         logger.error(f"PDF extraction error: {e}")
         raise HTTPException(status_code=400, detail="Invalid or corrupted PDF file")
+    except BrokenProcessPool as e:
+        # A worker died (native crash, OOM kill) — the pool is unusable until replaced
+        logger.error(f"PDF worker crashed: {e}")
+        await _replace_broken_pdf_pool(pool)
+        raise HTTPException(status_code=400, detail="Invalid or corrupted PDF file")
 
 
 # ============================================================================
@@ -166,15 +288,15 @@ Return ONLY this JSON (no markdown, no extra text):
 
     try:
         from skill_extractor import _groq_call
-        raw = await _groq_call(groq_client, [{"role": "user", "content": prompt}], temperature=0.3)
-        match = re.search(r"\{.*\}", raw, re.DOTALL)
-        if match:
-            parsed = json.loads(match.group())
-            return {
-                "summary": parsed.get("summary"),
-                "matched_areas": parsed.get("matched_areas", []),
-                "career_tips": parsed.get("career_tips", []),
-            }
+        raw = await _groq_call(
+            groq_client, [{"role": "user", "content": prompt}], temperature=0.3, json_mode=True
+        )
+        parsed = orjson.loads(raw)
+        return {
+            "summary": parsed.get("summary"),
+            "matched_areas": parsed.get("matched_areas", []),
+            "career_tips": parsed.get("career_tips", []),
+        }
     except groq_module.RateLimitError:
         raise
     except Exception as e:
@@ -202,10 +324,20 @@ def score_label(score: float) -> str:
 _FUZZY_THRESHOLD = 82  # partial_ratio threshold (0–100)
 
 
-def _skills_match(skill_a: str, skill_b: str) -> bool:
-    """True if two skill strings are similar enough via RapidFuzz partial_ratio."""
-    a, b = skill_a.lower().strip(), skill_b.lower().strip()
-    return fuzz.partial_ratio(a, b) >= _FUZZY_THRESHOLD
+def _fuzzy_hit(skill: str, choices: List[str]) -> bool:
+    """
+    True if any already-normalised choice scores >= _FUZZY_THRESHOLD against skill via RapidFuzz partial_ratio.
+    extractOne scores the whole list in C and stops early on a perfect match.
+    """
+    return process.extractOne(
+        skill, choices, scorer=fuzz.partial_ratio, score_cutoff=_FUZZY_THRESHOLD
+    ) is not None
+
+
+@functools.lru_cache(maxsize=2048)
+def _display_skill(skill: str) -> str:
+    """Title-case all-lowercase skills for display; deliberate casing (e.g. "GraphQL") is kept."""
+    return skill.title() if skill == skill.lower() else skill
 
 
 def find_matches(resume_skills: List[str], target_skills: List[str]) -> tuple[List[str], List[str]]:
@@ -218,18 +350,18 @@ def find_matches(resume_skills: List[str], target_skills: List[str]) -> tuple[Li
     """
     matched = []
     unmatched = []
-    resume_lower = [s.lower().strip() for s in resume_skills]
+    # Normalise + de-duplicate resume skills once; exact hits skip the fuzzy scan
+    resume_lower = list(dict.fromkeys(s.lower().strip() for s in resume_skills))
+    resume_set = frozenset(resume_lower)
 
     for ts in target_skills:
         ts_norm = ts.lower().strip()
         # Explicit OR handling: split "webpack/vite" → ["webpack", "vite"]
-        alternatives = [alt.strip() for alt in ts_norm.split("/")]
-        found = any(
-            _skills_match(alt, rs)
-            for alt in alternatives
-            for rs in resume_lower
+        alternatives = [alt.strip() for alt in ts_norm.split("/") if alt.strip()]
+        found = any(alt in resume_set for alt in alternatives) or any(
+            _fuzzy_hit(alt, resume_lower) for alt in alternatives
         )
-        display = ts.title() if ts == ts.lower() else ts
+        display = _display_skill(ts)
         if found:
             matched.append(display)
         else:
@@ -300,55 +432,44 @@ def calculate_score(
 
 
 # ============================================================================
-# API ENDPOINT
+# MATCH PIPELINE
 # ============================================================================
-@app.post("/api/calculate-match")
-async def calculate_match(
-    file: UploadFile = File(...),
-    job_description: str = Form(...),
-):
-    """Main endpoint: resume PDF + job description → match analysis."""
-
-    # 1. Extract resume text
-    resume_content = await file.read()
-    resume_text = extract_text_from_pdf(resume_content)
+async def read_resume_text(file: UploadFile) -> str:
+    """Read, close and parse one resume upload — the raw bytes are released before the LLM phase."""
+    try:
+        resume_content = await read_pdf_upload(file)
+    finally:
+        await file.close()
+    resume_text = await extract_text_from_pdf(resume_content)
+    del resume_content
 
     if len(resume_text) < 100:
         raise HTTPException(status_code=400, detail="Resume text too short or unreadable")
+    return resume_text
 
-    try:
-        # 2. Detect domain first (fast single call) — drives category generation
-        domain = "general"
-        if skill_extractor:
-            domain = await skill_extractor.detect_domain(job_description)
-            logger.info(f"Detected domain: {domain}")
-
-        # 3. Parallel: resume skill extraction + job extraction+categorisation + semantic similarity
-        async def extract_resume():
-            if skill_extractor:
-                return await skill_extractor.extract_resume(resume_text, domain=domain)
-            return []
 
-        async def extract_job():
-            if skill_extractor:
-                return await skill_extractor.extract_job_with_categories(job_description, domain=domain)
-            return {"required": [], "preferred": [], "categories": {}}
+async def semantic_score(resume_text: str, job_description: str) -> float:
+    if semantic_matcher and semantic_matcher.available:
+        return await semantic_matcher.similarity(resume_text, job_description)
+    return 0.0
 
-        async def semantic_sim():
-            if semantic_matcher and semantic_matcher.available:
-                return await semantic_matcher.similarity(resume_text, job_description)
-            return 0.0
 
-        resume_skills, job_reqs, sem_score = await asyncio.gather(
-            extract_resume(), extract_job(), semantic_sim()
-        )
+def _rate_limited() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="AI service rate limit reached. Please wait a moment and try again.",
+    )
 
-    except groq_module.RateLimitError:
-        raise HTTPException(
-            status_code=429,
-            detail="AI service rate limit reached. Please wait a moment and try again.",
-        )
 
+async def build_match_result(
+    resume_text: str,
+    job_description: str,
+    domain: str,
+    resume_skills: List[str],
+    job_reqs: Dict,
+    sem_score: float,
+) -> Dict:
+    """Blended score, category scores and AI narrative for one resume against extracted job requirements."""
     required  = job_reqs["required"]
     preferred = job_reqs["preferred"]
     categories = job_reqs["categories"]
@@ -358,37 +479,37 @@ async def calculate_match(
     logger.info(f"Preferred ({len(preferred)}): {preferred[:5]}")
     logger.info(f"Semantic similarity: {sem_score:.3f}")
 
-    # 3. Calculate blended score
-    result = calculate_score(resume_skills, required, preferred, sem_score)
+    # Blended score — fuzzy matching is CPU work, keep it off the event loop
+    result = await asyncio.to_thread(calculate_score, resume_skills, required, preferred, sem_score)
 
-    # 4. Per-category scores (uses Groq-provided category map)
+    # Per-category scores (uses Groq-provided category map)
     # Only include categories with at least one matched skill (score > 0) to avoid noise.
-    category_scores: Dict[str, int] = {}
-    if skill_extractor:
+    async def category_scores_task() -> Dict[str, int]:
+        if not skill_extractor:
+            return {}
         raw_category_scores = await asyncio.to_thread(
             skill_extractor.compute_category_scores_from_map,
             resume_skills,
             required,
             categories,
         )
-        category_scores = {cat: score for cat, score in raw_category_scores.items() if score > 0}
+        return {cat: score for cat, score in raw_category_scores.items() if score > 0}
 
-    # 5. Groq narrative (summary, matched_areas, career_tips)
+    # Groq narrative (summary, matched_areas, career_tips) — overlaps the category scoring thread
     try:
-        ai_analysis = await generate_ai_analysis(
-            resume_text,
-            job_description,
-            result["score"],
-            result["matched_skills"],
-            result["missing_critical"],
+        category_scores, ai_analysis = await asyncio.gather(
+            category_scores_task(),
+            generate_ai_analysis(
+                resume_text,
+                job_description,
+                result["score"],
+                result["matched_skills"],
+                result["missing_critical"],
+            ),
         )
     except groq_module.RateLimitError:
-        raise HTTPException(
-            status_code=429,
-            detail="AI service rate limit reached. Please wait a moment and try again.",
-        )
+        raise _rate_limited()
 
-    # 6. Score label
     label = score_label(result["score"])
 
     logger.info(f"Final score: {result['score']}% ({label})")
@@ -401,3 +522,108 @@ async def calculate_match(
         "ai_analysis": ai_analysis,
         "domain": domain,
     }
+
+
+# ============================================================================
+# API ENDPOINTS
+# ============================================================================
+@app.post("/api/calculate-match")
+async def calculate_match(
+    file: UploadFile = File(...),
+    job_description: str = Form(...),
+):
+    """Main endpoint: resume PDF + job description → match analysis."""
+
+    # 1. Extract resume text
+    resume_text = await read_resume_text(file)
+
+    try:
+        # 2. Skills chain: detect domain (drives category generation), then combined
+        #    resume + job extraction/categorisation in one Groq call
+        async def extract_skills():
+            domain = "general"
+            if not skill_extractor:
+                return domain, {"resume_skills": [], "required": [], "preferred": [], "categories": {}}
+            domain = await skill_extractor.detect_domain(job_description)
+            logger.info(f"Detected domain: {domain}")
+            return domain, await skill_extractor.extract_resume_and_job(resume_text, job_description, domain=domain)
+
+        # 3. Semantic similarity doesn't need the domain — runs alongside the whole skills chain
+        (domain, job_reqs), sem_score = await asyncio.gather(
+            extract_skills(), semantic_score(resume_text, job_description)
+        )
+
+    except groq_module.RateLimitError:
+        raise _rate_limited()
+
+    # 4. Score, categorise and narrate
+    return await build_match_result(
+        resume_text, job_description, domain, job_reqs["resume_skills"], job_reqs, sem_score
+    )
+
+
+_MAX_BATCH_FILES = int(os.getenv("MAX_BATCH_FILES", "20"))
+# Resumes scored at once per batch. Each makes up to three Groq calls (skills, semantic score,
+# narrative), so this allows ~30 concurrent Groq requests — rate limits still surface as 429s.
+_BATCH_CONCURRENCY = 10
+
+
+@app.post("/api/calculate-match-batch")
+async def calculate_match_batch(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(...),
+):
+    """
+    Batch endpoint: many resume PDFs + one job description → one match analysis per resume.
+    The job description is analysed once and shared; a failing resume reports its own error.
+    """
+    if len(files) > _MAX_BATCH_FILES:
+        for file in files:
+            await file.close()
+        raise HTTPException(status_code=400, detail=f"At most {_MAX_BATCH_FILES} resumes per batch")
+
+    # 1. Job side once: domain + required/preferred/categories
+    domain = "general"
+    job_reqs: Dict = {"required": [], "preferred": [], "categories": {}}
+    try:
+        if skill_extractor:
+            domain = await skill_extractor.detect_domain(job_description)
+            logger.info(f"Detected domain: {domain}")
+            job_reqs = await skill_extractor.extract_job_with_categories(job_description, domain=domain)
+    except groq_module.RateLimitError:
+        for file in files:
+            await file.close()
+        raise _rate_limited()
+
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    # 2. Per resume: text, resume skills + semantic similarity in parallel, then score
+    async def score_one(file: UploadFile) -> Dict:
+        async with semaphore:
+            try:
+                resume_text = await read_resume_text(file)
+
+                async def resume_skills_task() -> List[str]:
+                    if skill_extractor:
+                        return await skill_extractor.extract_resume(resume_text, domain=domain)
+                    return []
+
+                try:
+                    resume_skills, sem_score = await asyncio.gather(
+                        resume_skills_task(), semantic_score(resume_text, job_description)
+                    )
+                except groq_module.RateLimitError:
+                    raise _rate_limited()
+
+                result = await build_match_result(
+                    resume_text, job_description, domain, resume_skills, job_reqs, sem_score
+                )
+                return {"filename": file.filename, **result}
+            except HTTPException as e:
+                return {"filename": file.filename, "error": e.detail, "status_code": e.status_code}
+            except Exception as e:
+                logger.error(f"Batch scoring failed for {file.filename}: {e}")
+                return {"filename": file.filename, "error": "Internal error while scoring this resume", "status_code": 500}
+
+    results = await asyncio.gather(*(score_one(f) for f in files))
+    return {"domain": domain, "results": results}
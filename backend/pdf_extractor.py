@@ -0,0 +1,42 @@
+"""
+pdf_extractor.py
+----------------
+PDF → plain text, kept free of app imports so it can run inside a worker process.
+
+Uses pypdfium2 (PDFium C++ backend) when installed, pypdf otherwise.
+"""
+
+import io
+
+import pypdf
+
+# pypdfium2 optional import — native PDFium text extraction, pypdf otherwise
+try:
+    import pypdfium2 as pdfium
+    _PDFIUM_AVAILABLE = True
+except Exception:
+    _PDFIUM_AVAILABLE = False
+
+
+def warm_up() -> None:
+    """No-op task — submitting it makes a worker process spawn and import this module."""
+
+
+def extract_text(file_content: bytes) -> str:
+    """
+    Return the whitespace-normalised text of every page.
+    Raises ValueError for unreadable PDFs (plain exception type — safe to pickle across processes).
+    """
+    try:
+        if _PDFIUM_AVAILABLE:
+            pdf = pdfium.PdfDocument(file_content)
+            try:
+                text = " ".join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        else:
+            reader = pypdf.PdfReader(io.BytesIO(file_content))
+            text = " ".join(page.extract_text() or "" for page in reader.pages)
+    except Exception as e:
+        raise ValueError(str(e)) from None
+    return " ".join(text.split())
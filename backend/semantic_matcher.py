@@ -6,26 +6,101 @@ Groq-based semantic matching with sentence-transformers local fallback.
 Works for any industry — technology, healthcare, HR, finance, etc.
 """
 
+import hashlib
+import importlib.util
 import logging
-import json
-import re
-from typing import Optional
-from groq import Groq
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import orjson
+from groq import AsyncGroq
+
+from skill_extractor import GROQ_JSON_MODE
 
 logger = logging.getLogger(__name__)
 
-# sentence-transformers optional import — deterministic local fallback when Groq unavailable
-try:
-    from sentence_transformers import SentenceTransformer, util as st_util
-    _st_model = SentenceTransformer("all-MiniLM-L6-v2")
-    _ST_AVAILABLE = True
+_ST_MODEL_NAME = "all-MiniLM-L6-v2"
+# Dynamic-INT8 ONNX export published with the model — ~2-4x faster than FP32 PyTorch on CPU
+_ST_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+# sentence-transformers optional — only probed at import; torch and the model load on first use,
+# since the local fallback only runs when Groq scoring fails
+_ST_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+_st_model = None
+# Fallback scoring runs in worker threads — concurrent first calls must not each load the model
+_st_model_lock = threading.Lock()
+
+
+def _get_st_model():
+    """Load the embedding model once, on first use; later calls return it without locking."""
+    global _st_model
+    if _st_model is None:
+        with _st_model_lock:
+            if _st_model is None:
+                _st_model = _load_st_model()
+    return _st_model
+
+
+def _load_st_model():
+    """Prefers the quantised ONNX Runtime backend; falls back to the stock PyTorch weights."""
+    global _ST_AVAILABLE
+    try:
+        from sentence_transformers import SentenceTransformer
+    except Exception:
+        _ST_AVAILABLE = False  # installed but broken — stop retrying the import
+        raise
+    try:
+        model = SentenceTransformer(
+            _ST_MODEL_NAME, backend="onnx", model_kwargs={"file_name": _ST_ONNX_FILE}
+        )
+        logger.info("✅ sentence-transformers loaded (ONNX INT8) — local semantic fallback active")
+        return model
+    except Exception as e:
+        logger.info(f"ONNX INT8 backend unavailable ({e}) — using PyTorch weights")
+    try:
+        model = SentenceTransformer(_ST_MODEL_NAME)
+    except Exception:
+        _ST_AVAILABLE = False
+        raise
     logger.info("✅ sentence-transformers loaded — local semantic fallback active")
-except Exception:
-    _ST_AVAILABLE = False
+    return model
+
+
+# Embeddings of recently seen texts, keyed by content digest — repeat job postings skip the forward pass
+_EMBED_CACHE_SIZE = 4096
+_embed_cache: "OrderedDict[bytes, object]" = OrderedDict()
+_embed_lock = threading.Lock()
+
+
+def _encode_cached(texts: List[str]) -> list:
+    """
+    Normalised embeddings for texts, in input order.
+    Only cache misses reach the model, batched into a single encode call.
+    The cache is shared across threads; the lock is released while the model runs.
+    """
+    keys = [hashlib.blake2b(t.encode("utf-8", "surrogatepass"), digest_size=16).digest() for t in texts]
+    # Take the hits out under the lock — another thread may evict them once it is released
+    with _embed_lock:
+        found = {k: _embed_cache[k] for k in keys if k in _embed_cache}
+        for k in found:
+            _embed_cache.move_to_end(k)
+    misses = {k: t for k, t in zip(keys, texts) if k not in found}
+    if misses:
+        # Stored as float16 — half the cache footprint, well inside the score's precision
+        embs = _get_st_model().encode(list(misses.values()), normalize_embeddings=True).astype("float16")
+        new = dict(zip(misses, embs))
+        found.update(new)
+        with _embed_lock:
+            _embed_cache.update(new)
+            while len(_embed_cache) > _EMBED_CACHE_SIZE:
+                _embed_cache.popitem(last=False)
+    return [found[k] for k in keys]
 
 
 class SemanticMatcher:
-    def __init__(self, groq_client: Optional[Groq] = None):
+    def __init__(self, groq_client: Optional[AsyncGroq] = None):
         self._groq = groq_client
         logger.info("✅ SemanticMatcher (Groq-powered) ready")
 
@@ -52,10 +127,9 @@ class SemanticMatcher:
             try:
                 import asyncio
                 def _encode():
-                    embs = _st_model.encode(
-                        [text_a[:2000], text_b[:2000]], convert_to_tensor=True
-                    )
-                    return float(st_util.cos_sim(embs[0], embs[1]))
+                    # Unit-length vectors make cosine a plain dot product
+                    emb_a, emb_b = _encode_cached([text_a[:2000], text_b[:2000]])
+                    return float(emb_a @ emb_b)
                 score = await asyncio.to_thread(_encode)
                 return max(0.0, min(1.0, score))
             except Exception as e:
@@ -91,18 +165,14 @@ Job Description (first 3000 chars):
 JSON: {{ "score": 0.0 }}"""
 
         try:
-            import asyncio
-            completion = await asyncio.to_thread(
-                self._groq.chat.completions.create,
+            completion = await self._groq.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
                 model="llama-3.1-8b-instant",
                 temperature=0.0,
+                response_format=GROQ_JSON_MODE,
             )
-            raw = completion.choices[0].message.content or ""
-            m = re.search(r"\{.*\}", raw, re.DOTALL)
-            if m:
-                data = json.loads(m.group())
-                return float(max(0.0, min(1.0, data.get("score", 0.0))))
+            data = orjson.loads(completion.choices[0].message.content or "")
+            return float(max(0.0, min(1.0, data.get("score", 0.0))))
         except Exception as e:
             logger.error(f"Groq semantic similarity error: {e}")
 
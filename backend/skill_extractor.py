@@ -6,13 +6,18 @@ Supports any industry — technology, healthcare, HR, finance, legal, etc.
 """
 
 import asyncio
+import hashlib
 import logging
-import json
-import re
-from typing import List, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional, Tuple
 
+import orjson
 import groq as groq_module
-from groq import Groq
+from groq import AsyncGroq
+
+from keyword_scanner import KeywordScanner
 
 logger = logging.getLogger(__name__)
 
@@ -71,19 +76,100 @@ CATEGORY_KEYWORDS: Dict[str, List[str]] = {
     ],
 }
 
+# Every fallback keyword compiled into one scanner — a single pass over the text per call.
+_KEYWORD_SCANNER = KeywordScanner(
+    {kw: kw for keywords in CATEGORY_KEYWORDS.values() for kw in keywords}
+)
+
+
+def _scan_category(skill_lower: str) -> str:
+    """First CATEGORY_KEYWORDS category with a keyword overlapping the skill string."""
+    for cat, keywords in CATEGORY_KEYWORDS.items():
+        if any(kw in skill_lower or skill_lower in kw for kw in keywords):
+            return cat
+    return "tools"
+
+
+# Category answer for every known keyword, computed once — exact hits skip the scan.
+_KEYWORD_CATEGORY: Dict[str, str] = {
+    kw: _scan_category(kw) for keywords in CATEGORY_KEYWORDS.values() for kw in keywords
+}
+
+# Domain-specific category hints so Groq generates relevant categories
+_DOMAIN_CATEGORY_HINTS: Dict[str, str] = {
+    "technology":      "e.g. programming, frameworks, databases, devops, methodologies, tools",
+    "healthcare":      "e.g. clinical_skills, certifications, specializations, equipment, research, administrative",
+    "human_resources": "e.g. recruitment, hr_systems, compliance, training_development, compensation, strategy",
+    "finance":         "e.g. financial_analysis, certifications, regulatory, tools, methodologies, reporting",
+    "legal":           "e.g. practice_areas, certifications, litigation, research, compliance, tools",
+    "education":       "e.g. subject_expertise, pedagogy, certifications, technology, curriculum, assessment",
+    "marketing":       "e.g. digital_marketing, analytics, content, advertising, tools, strategy",
+    "sales":           "e.g. sales_methodology, crm_tools, negotiation, industry_knowledge, analytics",
+    "engineering":     "e.g. mechanical, electrical, civil, cad_tools, project_management, certifications",
+    "operations":      "e.g. process_management, supply_chain, logistics, erp_tools, quality, certifications",
+}
+_DEFAULT_CATEGORY_HINT = "e.g. core_skills, certifications, tools, methodologies, domain_knowledge"
+
+
+# Prompt rule blocks shared by the single-document and combined extraction prompts
+_RESUME_RULES = """Rules:
+- Include skills explicitly listed in any Skills section.
+- Include skills DEMONSTRATED through work experience only when the evidence is DIRECT and SPECIFIC — not by loose association.
+
+  VALID inference examples (clear, direct evidence):
+    "managed clinical trials for 200+ patients" → "clinical trial management"
+    "processed HR onboarding cases monthly" → "employee onboarding"
+    "built or rebuilt a React/Angular/Vue application" → "webpack"
+    "wrote code, built software, or performed software engineering as primary job" → "git"
+    "built websites or web interfaces that adapt to screen sizes" → "responsive design"
+
+  INVALID inference examples (do NOT do these):
+    "designed lesson plans" → do NOT infer "responsive design" or any web/tech skill
+    "analytical" or "problem solving" listed as skills → do NOT infer any tech tools
+    "designed performance improvement plans" → do NOT infer any software tools
+    any teaching, nursing, coaching, legal, accounting, or HR role → do NOT infer git, webpack, or developer tools
+
+- CRITICAL GATE: Only infer software/web development tools (git, webpack, npm, responsive design, etc.) if the resume EXPLICITLY describes the candidate's PRIMARY job function as software engineering, web development, or programming. A teacher, nurse, coach, or accountant does NOT imply developer tools under any circumstances.
+- Include certifications and professional qualifications (MD, CPA, SHRM-CP, PMP, teaching certification, etc.).
+- Do NOT include soft skills (communication, teamwork, leadership, problem solving, time management, accountability)."""
+
+_JOB_RULES = """WHAT TO EXTRACT: technologies, programming languages, frameworks, libraries, tools, platforms, certifications, licenses, methodologies, and specific domain knowledge areas.
 
-async def _groq_call(groq_client: Groq, messages: list, temperature: float = 0.1) -> str:
+WHAT TO EXCLUDE (do NOT extract these):
+- Soft skills and interpersonal traits: communication, collaboration, teamwork, leadership, attention to detail, design sense, problem-solving, time management, adaptability, creativity.
+- Vague qualities that cannot be verified on a resume: "keen eye for design", "passion for learning", "good judgment".
+- If a JD section is titled "Required Skills" but lists soft skills, skip those entries entirely.
+
+Classify each concrete skill as REQUIRED or PREFERRED using these strict rules:
+
+REQUIRED: A skill is required if it appears in a Requirements or Qualifications section.
+  - If the JD lists OR alternatives for the SAME requirement (e.g. "React, Angular, or Vue.js"), emit them as ONE entry using slash notation: "react/angular/vue.js". Do NOT emit them as separate entries.
+  - Apply the same rule to equivalent tools (e.g. "Webpack or Vite" → "webpack/vite"; "Workday or BambooHR" → "workday/bamboohr").
+  - One slot per distinct requirement.
+
+PREFERRED: A skill is preferred ONLY if the JD explicitly uses words like "nice to have", "bonus", "plus", "preferred", or groups them under a "Preferred Qualifications" heading."""
+
+
+# Groq JSON mode — the model must emit a single JSON object, so replies parse directly
+GROQ_JSON_MODE = {"type": "json_object"}
+
+
+async def _groq_call(
+    groq_client: AsyncGroq, messages: list, temperature: float = 0.1, json_mode: bool = False
+) -> str:
     """
     Run a Groq chat completion with one automatic retry on RateLimitError.
+    json_mode=True constrains the reply to one JSON object (the prompt must mention JSON).
     Raises groq_module.RateLimitError if it fails twice.
     """
+    extra = {"response_format": GROQ_JSON_MODE} if json_mode else {}
     for attempt in range(2):
         try:
-            completion = await asyncio.to_thread(
-                groq_client.chat.completions.create,
+            completion = await groq_client.chat.completions.create(
                 messages=messages,
                 model="llama-3.1-8b-instant",
                 temperature=temperature,
+                **extra,
             )
             return completion.choices[0].message.content or ""
         except groq_module.RateLimitError:
@@ -94,36 +180,128 @@ async def _groq_call(groq_client: Groq, messages: list, temperature: float = 0.1
                 raise  # re-raise on second failure
 
 
+_PROMPT_CHAR_LIMIT = 5000
+
+
+def _truncate(text: str, limit: int = _PROMPT_CHAR_LIMIT) -> str:
+    """
+    Bound prompt input to limit chars. Long documents keep their head and tail —
+    skills sections often sit at the end of a resume, so a plain head cut loses them.
+    """
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return text[:half] + " ... " + text[-half:]
+
+
+class _LRUCache:
+    """
+    Small in-process LRU for Groq extraction results, keyed by a content digest.
+    Entries expire after ttl seconds so prompt or model changes are picked up without a restart.
+    Values are stored as orjson bytes so every hit hands back a fresh, caller-owned copy.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Digest of the inputs — identical resumes / job descriptions map to the same entry."""
+        h = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            h.update(part.encode("utf-8", "surrogatepass"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, blob = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return orjson.loads(blob)
+
+    def put(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, orjson.dumps(value))
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+# SkillNer results by content digest — a repeated job description skips the spaCy pass.
+# Only successes are stored, so a transient failure is retried; shared across to_thread workers.
+_SKILLNER_CACHE_SIZE = 256
+_skillner_cache: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+_skillner_lock = threading.Lock()
+
+
 def _keyword_fallback(text: str) -> List[str]:
     """
     Extract skills from text when Groq is unavailable.
     Uses SkillNer (spaCy) when available — covers all industries.
     Falls back to CATEGORY_KEYWORDS keyword scan as a last resort.
+    Blocking (spaCy runs over the whole document) — async callers use asyncio.to_thread.
     """
     if _SKILLNER_AVAILABLE:
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with _skillner_lock:
+            cached = _skillner_cache.get(key)
+            if cached is not None:
+                _skillner_cache.move_to_end(key)
+                return list(cached)
         try:
             doc = _nlp(text)
             annotations = _skill_ner.annotate(doc)
             full_matches = annotations.get("results", {}).get("full_matches", [])
-            return [s["doc_node_value"].lower().strip() for s in full_matches]
+            skills = tuple(s["doc_node_value"].lower().strip() for s in full_matches)
         except Exception as e:
             logger.warning(f"SkillNer extraction failed: {e}")
+        else:
+            with _skillner_lock:
+                _skillner_cache[key] = skills
+                while len(_skillner_cache) > _SKILLNER_CACHE_SIZE:
+                    _skillner_cache.popitem(last=False)
+            return list(skills)
 
-    # Last-resort: keyword scan
-    text_lower = text.lower()
-    found: List[str] = []
-    seen: set = set()
-    for keywords in CATEGORY_KEYWORDS.values():
-        for kw in keywords:
-            if kw not in seen and kw in text_lower:
-                found.append(kw)
-                seen.add(kw)
-    return found
+    # Last-resort: whole-word keyword scan
+    return _KEYWORD_SCANNER.scan(text)
+
+
+def _normalize_skills(skills: List[str]) -> List[str]:
+    """Lowercase/strip each distinct raw string once, keeping first-seen order and dropping blanks."""
+    normalized = (s.lower().strip() for s in dict.fromkeys(skills))
+    return [s for s in dict.fromkeys(normalized) if s]
+
+
+def _parse_job_response(parsed: Dict) -> Dict:
+    """Normalise Groq's required/preferred/categories JSON into the extractor's job dict."""
+    required = _normalize_skills(parsed.get("required", []))
+    # A skill repeated in both buckets counts as required only
+    required_set = set(required)
+    preferred = [s for s in _normalize_skills(parsed.get("preferred", [])) if s not in required_set]
+    categories = {k.lower().strip(): v for k, v in parsed.get("categories", {}).items()}
+
+    # Ensure every extracted skill is assigned somewhere
+    classified = required_set.union(preferred)
+    required.extend(s for s in categories if s not in classified)
+
+    return {
+        "required": required,
+        "preferred": preferred,
+        "categories": categories,
+    }
 
 
 class SkillExtractor:
-    def __init__(self, groq_client: Optional[Groq] = None):
+    def __init__(self, groq_client: Optional[AsyncGroq] = None):
         self._groq = groq_client
+        # Only successful Groq answers are cached — fallbacks are cheap and retried next time
+        self._cache = _LRUCache(maxsize=1024)
         logger.info("✅ SkillExtractor (Groq-powered) ready")
 
     async def detect_domain(self, job_text: str) -> str:
@@ -144,11 +322,22 @@ Job Description (first 600 chars):
 
 JSON: {{"domain": "technology"}}"""
 
+        key = _LRUCache.key("domain", job_text[:600])
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            raw = await _groq_call(self._groq, [{"role": "user", "content": prompt}], temperature=0.0)
-            m = re.search(r"\{.*\}", raw, re.DOTALL)
-            if m:
-                return json.loads(m.group()).get("domain", "general")
+            raw = await _groq_call(
+                self._groq, [{"role": "user", "content": prompt}], temperature=0.0, json_mode=True
+            )
+            domain = orjson.loads(raw).get("domain")
+            # Only a non-empty string is usable — the label feeds cache keys and prompts downstream
+            if isinstance(domain, str) and domain.strip():
+                domain = domain.strip()
+                self._cache.put(key, domain)
+                return domain
+            logger.warning(f"Domain detection returned {domain!r} — using 'general'")
         except Exception as e:
             logger.warning(f"Domain detection failed: {e}")
         return "general"
@@ -159,48 +348,41 @@ JSON: {{"domain": "technology"}}"""
         Works for any industry. Falls back to SkillNer/keyword scanning if Groq is unavailable.
         """
         if not self._groq:
-            return _keyword_fallback(text)
+            return await asyncio.to_thread(_keyword_fallback, text)
+
+        prompt_text = _truncate(text)
+        key = _LRUCache.key("resume", domain, prompt_text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
         prompt = f"""Extract ALL professional skills, competencies, tools, certifications, and methodologies from this resume.
-Return ONLY a valid JSON array of strings. Do not include soft skills.
+Return ONLY a JSON object with a single 'skills' key holding an array of strings. Do not include soft skills.
 
 Domain context: {domain}
 
-Rules:
-- Include skills explicitly listed in any Skills section.
-- Include skills DEMONSTRATED through work experience only when the evidence is DIRECT and SPECIFIC — not by loose association.
-
-  VALID inference examples (clear, direct evidence):
-    "managed clinical trials for 200+ patients" → "clinical trial management"
-    "processed HR onboarding cases monthly" → "employee onboarding"
-    "built or rebuilt a React/Angular/Vue application" → "webpack"
-    "wrote code, built software, or performed software engineering as primary job" → "git"
-    "built websites or web interfaces that adapt to screen sizes" → "responsive design"
-
-  INVALID inference examples (do NOT do these):
-    "designed lesson plans" → do NOT infer "responsive design" or any web/tech skill
-    "analytical" or "problem solving" listed as skills → do NOT infer any tech tools
-    "designed performance improvement plans" → do NOT infer any software tools
-    any teaching, nursing, coaching, legal, accounting, or HR role → do NOT infer git, webpack, or developer tools
-
-- CRITICAL GATE: Only infer software/web development tools (git, webpack, npm, responsive design, etc.) if the resume EXPLICITLY describes the candidate's PRIMARY job function as software engineering, web development, or programming. A teacher, nurse, coach, or accountant does NOT imply developer tools under any circumstances.
-- Include certifications and professional qualifications (MD, CPA, SHRM-CP, PMP, teaching certification, etc.).
-- Do NOT include soft skills (communication, teamwork, leadership, problem solving, time management, accountability).
+{_RESUME_RULES}
 
 Text:
-{text[:5000]}"""
+{prompt_text}
+
+JSON: {{"skills": ["skill1", "skill2"]}}"""
 
         try:
-            raw = await _groq_call(self._groq, [{"role": "user", "content": prompt}], temperature=0.1)
-            match = re.search(r"\[.*\]", raw, re.DOTALL)
-            if match:
-                return [s.lower().strip() for s in json.loads(match.group())]
+            raw = await _groq_call(
+                self._groq, [{"role": "user", "content": prompt}], temperature=0.1, json_mode=True
+            )
+            skills = orjson.loads(raw).get("skills")
+            if isinstance(skills, list):
+                skills = _normalize_skills(skills)
+                self._cache.put(key, skills)
+                return skills
         except groq_module.RateLimitError:
             raise  # handled by caller
         except Exception as e:
             logger.error(f"Groq resume skill extraction error: {e}")
 
-        return _keyword_fallback(text)
+        return await asyncio.to_thread(_keyword_fallback, text)
 
     async def extract_job_with_categories(self, job_text: str, domain: str = "general") -> Dict:
         """
@@ -216,43 +398,22 @@ Text:
         """
         fallback = {"required": [], "preferred": [], "categories": {}}
         if not self._groq:
-            skills = _keyword_fallback(job_text)
+            skills = await asyncio.to_thread(_keyword_fallback, job_text)
             fallback["required"] = skills
             fallback["categories"] = {s: self._categorize_one(s) for s in skills}
             return fallback
 
-        # Domain-specific category hint so Groq generates relevant categories
-        domain_hints = {
-            "technology":      "e.g. programming, frameworks, databases, devops, methodologies, tools",
-            "healthcare":      "e.g. clinical_skills, certifications, specializations, equipment, research, administrative",
-            "human_resources": "e.g. recruitment, hr_systems, compliance, training_development, compensation, strategy",
-            "finance":         "e.g. financial_analysis, certifications, regulatory, tools, methodologies, reporting",
-            "legal":           "e.g. practice_areas, certifications, litigation, research, compliance, tools",
-            "education":       "e.g. subject_expertise, pedagogy, certifications, technology, curriculum, assessment",
-            "marketing":       "e.g. digital_marketing, analytics, content, advertising, tools, strategy",
-            "sales":           "e.g. sales_methodology, crm_tools, negotiation, industry_knowledge, analytics",
-            "engineering":     "e.g. mechanical, electrical, civil, cad_tools, project_management, certifications",
-            "operations":      "e.g. process_management, supply_chain, logistics, erp_tools, quality, certifications",
-        }
-        category_hint = domain_hints.get(domain, "e.g. core_skills, certifications, tools, methodologies, domain_knowledge")
-
-        prompt = f"""Analyse this job description. Extract concrete, verifiable skills only.
-
-WHAT TO EXTRACT: technologies, programming languages, frameworks, libraries, tools, platforms, certifications, licenses, methodologies, and specific domain knowledge areas.
-
-WHAT TO EXCLUDE (do NOT extract these):
-- Soft skills and interpersonal traits: communication, collaboration, teamwork, leadership, attention to detail, design sense, problem-solving, time management, adaptability, creativity.
-- Vague qualities that cannot be verified on a resume: "keen eye for design", "passion for learning", "good judgment".
-- If a JD section is titled "Required Skills" but lists soft skills, skip those entries entirely.
+        prompt_job = _truncate(job_text)
+        key = _LRUCache.key("job", domain, prompt_job)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-Classify each concrete skill as REQUIRED or PREFERRED using these strict rules:
+        category_hint = _DOMAIN_CATEGORY_HINTS.get(domain, _DEFAULT_CATEGORY_HINT)
 
-REQUIRED: A skill is required if it appears in a Requirements or Qualifications section.
-  - If the JD lists OR alternatives for the SAME requirement (e.g. "React, Angular, or Vue.js"), emit them as ONE entry using slash notation: "react/angular/vue.js". Do NOT emit them as separate entries.
-  - Apply the same rule to equivalent tools (e.g. "Webpack or Vite" → "webpack/vite"; "Workday or BambooHR" → "workday/bamboohr").
-  - One slot per distinct requirement.
+        prompt = f"""Analyse this job description. Extract concrete, verifiable skills only.
 
-PREFERRED: A skill is preferred ONLY if the JD explicitly uses words like "nice to have", "bonus", "plus", "preferred", or groups them under a "Preferred Qualifications" heading.
+{_JOB_RULES}
 
 Also assign each skill to a category appropriate for a {domain} role ({category_hint}).
 Only create categories that have at least 2 skills. Use 3-5 categories maximum.
@@ -266,48 +427,111 @@ Return ONLY valid JSON — no markdown, no extra text:
 }}
 
 Job Description:
-{job_text[:5000]}"""
+{prompt_job}"""
 
         try:
-            raw = await _groq_call(self._groq, [{"role": "user", "content": prompt}], temperature=0.1)
-            match = re.search(r"\{.*\}", raw, re.DOTALL)
-            if match:
-                parsed = json.loads(match.group())
-                required = [s.lower().strip() for s in parsed.get("required", [])]
-                preferred = [s.lower().strip() for s in parsed.get("preferred", [])]
-                categories = {k.lower().strip(): v for k, v in parsed.get("categories", {}).items()}
-
-                # Ensure every extracted skill is assigned somewhere
-                all_classified = set(required + preferred)
-                for s in list(categories.keys()):
-                    if s not in all_classified:
-                        required.append(s)
-
-                return {
-                    "required": list(dict.fromkeys(required)),
-                    "preferred": list(dict.fromkeys(preferred)),
-                    "categories": categories,
-                }
+            raw = await _groq_call(
+                self._groq, [{"role": "user", "content": prompt}], temperature=0.1, json_mode=True
+            )
+            job_reqs = _parse_job_response(orjson.loads(raw))
+            self._cache.put(key, job_reqs)
+            return job_reqs
         except groq_module.RateLimitError:
             raise
         except Exception as e:
             logger.error(f"Groq job extraction error: {e}")
 
         # Fallback: keyword scan, treat all as required
-        skills = _keyword_fallback(job_text)
+        skills = await asyncio.to_thread(_keyword_fallback, job_text)
         return {
             "required": skills,
             "preferred": [],
             "categories": {s: self._categorize_one(s) for s in skills},
         }
 
+    async def extract_resume_and_job(self, resume_text: str, job_text: str, domain: str = "general") -> Dict:
+        """
+        Single Groq call covering both documents — resume skills plus the job's
+        required/preferred split and category map.
+
+        Returns:
+            {
+              "resume_skills": ["skill1", ...],
+              "required":      ["skill2", ...],
+              "preferred":     ["skill3", ...],
+              "categories":    {"skill2": "programming", ...}
+            }
+
+        Falls back to separate extract_resume / extract_job_with_categories calls
+        when Groq is unavailable or the combined response cannot be parsed.
+        """
+        if self._groq:
+            prompt_resume, prompt_job = _truncate(resume_text), _truncate(job_text)
+            key = _LRUCache.key("resume_and_job", domain, prompt_resume, prompt_job)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+            category_hint = _DOMAIN_CATEGORY_HINTS.get(domain, _DEFAULT_CATEGORY_HINT)
+
+            prompt = f"""You are given a RESUME and a JOB DESCRIPTION for a {domain} role. Complete both parts below.
+
+PART 1 — RESUME SKILLS
+Extract ALL professional skills, competencies, tools, certifications, and methodologies from the resume.
+
+{_RESUME_RULES}
+
+PART 2 — JOB REQUIREMENTS
+Analyse the job description. Extract concrete, verifiable skills only.
+
+{_JOB_RULES}
+
+Also assign each job skill to a category appropriate for a {domain} role ({category_hint}).
+Only create categories that have at least 2 skills. Use 3-5 categories maximum.
+For slash-notation skills, use the category of the first option.
+
+Return ONLY valid JSON — no markdown, no extra text:
+{{
+  "resume_skills": ["skill a", "skill b"],
+  "required":      ["skill1", "react/angular/vue.js"],
+  "preferred":     ["skill3"],
+  "categories":    {{"skill1": "programming", "react/angular/vue.js": "frameworks", "skill3": "tools"}}
+}}
+
+Resume:
+{prompt_resume}
+
+Job Description:
+{prompt_job}"""
+
+            try:
+                raw = await _groq_call(
+                    self._groq, [{"role": "user", "content": prompt}], temperature=0.1, json_mode=True
+                )
+                parsed = orjson.loads(raw)
+                if isinstance(parsed.get("resume_skills"), list):
+                    result = {
+                        "resume_skills": _normalize_skills(parsed["resume_skills"]),
+                        **_parse_job_response(parsed),
+                    }
+                    self._cache.put(key, result)
+                    return result
+            except groq_module.RateLimitError:
+                raise
+            except Exception as e:
+                logger.error(f"Groq combined extraction error: {e}")
+
+        resume_skills, job_reqs = await asyncio.gather(
+            self.extract_resume(resume_text, domain=domain),
+            self.extract_job_with_categories(job_text, domain=domain),
+        )
+        return {"resume_skills": resume_skills, **job_reqs}
+
     def _categorize_one(self, skill: str) -> str:
         """Assign a single skill to a category using CATEGORY_KEYWORDS fallback."""
         skill_lower = skill.lower()
-        for cat, keywords in CATEGORY_KEYWORDS.items():
-            if any(kw in skill_lower or skill_lower in kw for kw in keywords):
-                return cat
-        return "tools"
+        cat = _KEYWORD_CATEGORY.get(skill_lower)
+        return cat if cat is not None else _scan_category(skill_lower)
 
     def compute_category_scores_from_map(
         self,
@@ -319,24 +543,29 @@ Job Description:
         Compute per-category match scores using the Groq-provided category map.
         Falls back to CATEGORY_KEYWORDS for skills not in the map.
         """
+        def category_of(skill: str) -> str:
+            # Only scan CATEGORY_KEYWORDS when the map has no answer
+            cat = categories.get(skill.lower())
+            return cat if cat is not None else self._categorize_one(skill)
+
         # Group required skills by category
         required_by_cat: Dict[str, List[str]] = {}
         for skill in required_skills:
-            cat = categories.get(skill.lower(), self._categorize_one(skill))
-            required_by_cat.setdefault(cat, []).append(skill)
+            required_by_cat.setdefault(category_of(skill), []).append(skill)
 
         # Group resume skills by category
         resume_by_cat: Dict[str, List[str]] = {}
         for skill in resume_skills:
-            cat = categories.get(skill.lower(), self._categorize_one(skill))
-            resume_by_cat.setdefault(cat, []).append(skill)
+            resume_by_cat.setdefault(category_of(skill), []).append(skill)
 
         scores: Dict[str, int] = {}
         for cat, req_list in required_by_cat.items():
             res_list = resume_by_cat.get(cat, [])
+            # Exact hits resolve with one set lookup; only the rest pay the substring scan
+            res_set = frozenset(res_list)
             matched = sum(
                 1 for r in req_list
-                if any(r in rs or rs in r for rs in res_list)
+                if r in res_set or any(r in rs or rs in r for rs in res_list)
             )
             scores[cat] = round((matched / len(req_list)) * 100)
 
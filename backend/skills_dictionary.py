@@ -2,214 +2,254 @@
 Skill synonym dictionary and helpers for hybrid resume-job matching.
 
 This module exposes:
-- SKILL_SYNONYMS: Dict[str, List[str]]
-- SKILL_CATEGORIES: Dict[str, List[str]]
+- SKILL_SYNONYMS: Mapping[str, Tuple[str, ...]] (read-only)
+- SKILL_CATEGORIES: Mapping[str, Tuple[str, ...]] (read-only)
 - get_all_skills() -> List[str]
+- get_all_skills_set() -> FrozenSet[str]   (prefer for membership tests)
 - find_standard_skill(text: str) -> Optional[str]
+- find_standard_skill_fast(normalized: str) -> Optional[str]
+- find_standard_skills(text: str) -> Tuple[str, ...]
+- find_standard_skills_batch(tokens: Iterable[str]) -> List[Optional[str]]
+- extract_skills(text: str) -> List[str]
+- scan_skills(text: str) -> List[Tuple[int, int, str]]
 - get_skill_synonyms(canonical: str) -> List[str]
+- get_skill_synonyms_fast(canonical_lower: str) -> Tuple[str, ...]
 - get_skill_category(canonical: str) -> Optional[str]
 - get_skills_in_category(category: str) -> List[str]
 """
 
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+import functools
 import json
+import sys
+from itertools import chain
 
+from keyword_scanner import KeywordScanner
 
-def _norm(tokens: List[str]) -> List[str]:
-    """Lowercase + de-duplicate while preserving order."""
-    seen = set()
-    out: List[str] = []
-    for t in tokens:
-        s = (t or "").strip().lower()
-        if not s:
-            continue
-        if s not in seen:
-            seen.add(s)
-            out.append(s)
-    return out
+
+def _norm(tokens: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Lowercase + de-duplicate while preserving order. Tuples — the dictionary is read-only.
+    Interned, so a synonym equal to a canonical key or category member is the same object.
+    """
+    return tuple(dict.fromkeys(sys.intern(s) for s in ((t or "").strip().lower() for t in tokens) if s))
 
 
-# Canonical skill map with expanded categories
-SKILL_SYNONYMS: Dict[str, List[str]] = {
+# Canonical skill map with expanded categories.
+# Entries are plain tuples — normalised (lowercase, de-duplicated, interned) in one pass below.
+_SKILL_SYNONYMS_SRC: Dict[str, Tuple[str, ...]] = {
     # Programming languages
-    "javascript": _norm(["javascript", "js", "ecmascript", "es6", "es2015", "es2020", "vanilla js"]),
-    "typescript": _norm(["typescript", "ts", "typescript developer"]),
-    "python": _norm(["python", "py", "python3", "python programming"]),
-    "java": _norm(["java", "java programming", "java developer"]),
-    "csharp": _norm(["c#", "c sharp", "csharp", ".net", "dotnet", "asp.net", "asp.net core", "aspnet"]),
-    "php": _norm(["php", "php programming", "php developer"]),
-    "ruby": _norm(["ruby", "ruby programming", "ruby developer"]),
-    "go": _norm(["go", "golang"]),
-    "rust": _norm(["rust", "rust programming"]),
-    "swift": _norm(["swift", "swift programming"]),
-    "kotlin": _norm(["kotlin", "kotlin programming"]),
+    "javascript": ("javascript", "js", "ecmascript", "es6", "es2015", "es2020", "vanilla js"),
+    "typescript": ("typescript", "ts", "typescript developer"),
+    "python": ("python", "py", "python3", "python programming"),
+    "java": ("java", "java programming", "java developer"),
+    "csharp": ("c#", "c sharp", "csharp", ".net", "dotnet", "asp.net", "asp.net core", "aspnet"),
+    "php": ("php", "php programming", "php developer"),
+    "ruby": ("ruby", "ruby programming", "ruby developer"),
+    "go": ("go", "golang"),
+    "rust": ("rust", "rust programming"),
+    "swift": ("swift", "swift programming"),
+    "kotlin": ("kotlin", "kotlin programming"),
     
     # Frontend frameworks & libraries
-    "react": _norm(["react", "reactjs", "react.js", "react native", "react developer"]),
-    "angular": _norm(["angular", "angularjs", "angular.js"]),
-    "vue": _norm(["vue", "vuejs", "vue.js", "nuxt.js", "nuxt"]),
-    "svelte": _norm(["svelte", "sveltejs"]),
-    "jquery": _norm(["jquery", "jquery ui"]),
+    "react": ("react", "reactjs", "react.js", "react native", "react developer"),
+    "angular": ("angular", "angularjs", "angular.js"),
+    "vue": ("vue", "vuejs", "vue.js", "nuxt.js", "nuxt"),
+    "svelte": ("svelte", "sveltejs"),
+    "jquery": ("jquery", "jquery ui"),
     
     # Frontend tools & styling
-    "html": _norm(["html", "html5", "hypertext markup language"]),
-    "css": _norm(["css", "css3", "cascading style sheets", "sass", "scss", "less"]),
-    "tailwind": _norm(["tailwind", "tailwind css", "tailwindcss"]),
-    "bootstrap": _norm(["bootstrap", "twitter bootstrap"]),
-    "material_ui": _norm(["material ui", "mui", "material design"]),
-    "vite": _norm(["vite", "vitejs"]),
-    "webpack": _norm(["webpack", "webpack bundler"]),
+    "html": ("html", "html5", "hypertext markup language"),
+    "css": ("css", "css3", "cascading style sheets", "sass", "scss", "less"),
+    "tailwind": ("tailwind", "tailwind css", "tailwindcss"),
+    "bootstrap": ("bootstrap", "twitter bootstrap"),
+    "material_ui": ("material ui", "mui", "material design"),
+    "vite": ("vite", "vitejs"),
+    "webpack": ("webpack", "webpack bundler"),
     
     # Backend frameworks
-    "nodejs": _norm(["node.js", "nodejs", "node", "express", "express.js", "expressjs", "nestjs"]),
-    "django": _norm(["django", "django python"]),
-    "flask": _norm(["flask", "flask python"]),
-    "fastapi": _norm(["fastapi", "fast api"]),
-    "spring": _norm(["spring", "spring boot", "springboot", "spring framework"]),
-    "laravel": _norm(["laravel", "laravel php"]),
-    "rails": _norm(["rails", "ruby on rails", "ror"]),
-    "aspnet": _norm(["asp.net", "aspnet", "asp.net core"]),
+    "nodejs": ("node.js", "nodejs", "node", "express", "express.js", "expressjs", "nestjs"),
+    "django": ("django", "django python"),
+    "flask": ("flask", "flask python"),
+    "fastapi": ("fastapi", "fast api"),
+    "spring": ("spring", "spring boot", "springboot", "spring framework"),
+    "laravel": ("laravel", "laravel php"),
+    "rails": ("rails", "ruby on rails", "ror"),
+    "aspnet": ("asp.net", "aspnet", "asp.net core"),
     
     # Databases
-    "postgresql": _norm(["postgresql", "postgres", "postgres sql", "pg"]),
-    "mysql": _norm(["mysql", "my sql", "mariadb"]),
-    "mongodb": _norm(["mongodb", "mongo", "mongo db"]),
-    "sqlite": _norm(["sqlite", "sqlite3"]),
-    "redis": _norm(["redis", "redis cache"]),
-    "sql": _norm(["sql", "structured query language"]),
-    "nosql": _norm(["nosql", "non relational database"]),
-    "supabase": _norm(["supabase"]),
-    "firebase": _norm(["firebase", "google firebase"]),
+    "postgresql": ("postgresql", "postgres", "postgres sql", "pg"),
+    "mysql": ("mysql", "my sql", "mariadb"),
+    "mongodb": ("mongodb", "mongo", "mongo db"),
+    "sqlite": ("sqlite", "sqlite3"),
+    "redis": ("redis", "redis cache"),
+    "sql": ("sql", "structured query language"),
+    "nosql": ("nosql", "non relational database"),
+    "supabase": ("supabase",),
+    "firebase": ("firebase", "google firebase"),
     
     # Cloud & DevOps
-    "aws": _norm(["aws", "amazon web services", "amazon aws"]),
-    "azure": _norm(["azure", "microsoft azure"]),
-    "gcp": _norm(["gcp", "google cloud", "google cloud platform"]),
-    "vercel": _norm(["vercel"]),
-    "railway": _norm(["railway", "railway app"]),
-    "digitalocean": _norm(["digitalocean", "digital ocean", "do"]),
-    "docker": _norm(["docker", "docker containers", "containerization"]),
-    "kubernetes": _norm(["kubernetes", "k8s", "kube"]),
-    "jenkins": _norm(["jenkins", "jenkins ci"]),
-    "github_actions": _norm(["github actions", "github ci/cd"]),
-    "gitlab": _norm(["gitlab", "gitlab ci"]),
+    "aws": ("aws", "amazon web services", "amazon aws"),
+    "azure": ("azure", "microsoft azure"),
+    "gcp": ("gcp", "google cloud", "google cloud platform"),
+    "vercel": ("vercel",),
+    "railway": ("railway", "railway app"),
+    "digitalocean": ("digitalocean", "digital ocean", "do"),
+    "docker": ("docker", "docker containers", "containerization"),
+    "kubernetes": ("kubernetes", "k8s", "kube"),
+    "jenkins": ("jenkins", "jenkins ci"),
+    "github_actions": ("github actions", "github ci/cd"),
+    "gitlab": ("gitlab", "gitlab ci"),
     
     # Tools & Version Control
-    "git": _norm(["git", "git version control"]),
-    "github": _norm(["github"]),
-    "gitlab_tool": _norm(["gitlab"]),
-    "bitbucket": _norm(["bitbucket"]),
-    "vscode": _norm(["vscode", "visual studio code", "vs code"]),
-    "intellij": _norm(["intellij", "intellij idea"]),
-    "webstorm": _norm(["webstorm"]),
-    "postman": _norm(["postman", "api testing"]),
+    "git": ("git", "git version control"),
+    "github": ("github",),
+    "gitlab_tool": ("gitlab",),
+    "bitbucket": ("bitbucket",),
+    "vscode": ("vscode", "visual studio code", "vs code"),
+    "intellij": ("intellij", "intellij idea"),
+    "webstorm": ("webstorm",),
+    "postman": ("postman", "api testing"),
     
     # APIs & Services
-    "rest": _norm(["rest", "rest api", "restful", "restful api"]),
-    "graphql": _norm(["graphql", "graphql api"]),
-    "grpc": _norm(["grpc", "g rpc"]),
-    "groq": _norm(["groq", "groq ai"]),
-    "openai": _norm(["openai", "openai api", "chatgpt api"]),
-    "deepgram": _norm(["deepgram"]),
+    "rest": ("rest", "rest api", "restful", "restful api"),
+    "graphql": ("graphql", "graphql api"),
+    "grpc": ("grpc", "g rpc"),
+    "groq": ("groq", "groq ai"),
+    "openai": ("openai", "openai api", "chatgpt api"),
+    "deepgram": ("deepgram",),
     
     # Concepts & Methodologies
-    "oop": _norm(["oop", "object oriented programming", "object oriented", "object-oriented"]),
-    "functional_programming": _norm(["functional programming", "fp"]),
-    "mvc": _norm(["mvc", "model view controller"]),
-    "microservices": _norm(["microservices", "microservice architecture"]),
-    "serverless": _norm(["serverless", "serverless architecture"]),
-    "agile": _norm(["agile", "agile methodology", "scrum", "kanban"]),
-    "tdd": _norm(["tdd", "test driven development"]),
-    "bdd": _norm(["bdd", "behavior driven development"]),
+    "oop": ("oop", "object oriented programming", "object oriented", "object-oriented"),
+    "functional_programming": ("functional programming", "fp"),
+    "mvc": ("mvc", "model view controller"),
+    "microservices": ("microservices", "microservice architecture"),
+    "serverless": ("serverless", "serverless architecture"),
+    "agile": ("agile", "agile methodology", "scrum", "kanban"),
+    "tdd": ("tdd", "test driven development"),
+    "bdd": ("bdd", "behavior driven development"),
     
     # Web Development Concepts
-    "responsive_design": _norm(["responsive design", "responsive web design", "mobile responsive"]),
-    "web_accessibility": _norm(["accessibility", "a11y", "web accessibility", "wcag"]),
-    "cross_browser": _norm(["cross browser", "cross browser compatibility"]),
-    "seo": _norm(["seo", "search engine optimization"]),
-    "web_performance": _norm(["web performance", "performance optimization", "page speed"]),
-    "web_security": _norm(["web security", "security", "owasp", "xss", "csrf", "sql injection"]),
+    "responsive_design": ("responsive design", "responsive web design", "mobile responsive"),
+    "web_accessibility": ("accessibility", "a11y", "web accessibility", "wcag"),
+    "cross_browser": ("cross browser", "cross browser compatibility"),
+    "seo": ("seo", "search engine optimization"),
+    "web_performance": ("web performance", "performance optimization", "page speed"),
+    "web_security": ("web security", "security", "owasp", "xss", "csrf", "sql injection"),
     
     # Testing
-    "jest": _norm(["jest", "jest js"]),
-    "mocha": _norm(["mocha", "mocha js"]),
-    "cypress": _norm(["cypress", "cypress.io"]),
-    "pytest": _norm(["pytest", "python test"]),
-    "unit_testing": _norm(["unit testing", "unit tests"]),
-    "integration_testing": _norm(["integration testing", "integration tests"]),
-    "e2e_testing": _norm(["end to end testing", "e2e testing"]),
+    "jest": ("jest", "jest js"),
+    "mocha": ("mocha", "mocha js"),
+    "cypress": ("cypress", "cypress.io"),
+    "pytest": ("pytest", "python test"),
+    "unit_testing": ("unit testing", "unit tests"),
+    "integration_testing": ("integration testing", "integration tests"),
+    "e2e_testing": ("end to end testing", "e2e testing"),
     
     # Data & Analytics
-    "data_visualization": _norm(["data visualization", "charts", "d3.js", "chart.js"]),
-    "machine_learning": _norm(["machine learning", "ml", "ai"]),
-    "data_analysis": _norm(["data analysis", "data analytics"]),
-    "pandas": _norm(["pandas", "python pandas"]),
-    "numpy": _norm(["numpy", "python numpy"]),
+    "data_visualization": ("data visualization", "charts", "d3.js", "chart.js"),
+    "machine_learning": ("machine learning", "ml", "ai"),
+    "data_analysis": ("data analysis", "data analytics"),
+    "pandas": ("pandas", "python pandas"),
+    "numpy": ("numpy", "python numpy"),
     
     # Networking & Infrastructure
-    "http": _norm(["http", "https", "http/2", "http2"]),
-    "websocket": _norm(["websocket", "websockets", "real-time"]),
-    "cdn": _norm(["cdn", "content delivery network"]),
-    "dns": _norm(["dns", "domain name system"]),
-    "ssl": _norm(["ssl", "tls", "https"]),
-    "load_balancing": _norm(["load balancing", "load balancer"]),
-    "nginx": _norm(["nginx", "nginx web server"]),
-    "apache": _norm(["apache", "apache http server"]),
+    "http": ("http", "https", "http/2", "http2"),
+    "websocket": ("websocket", "websockets", "real-time"),
+    "cdn": ("cdn", "content delivery network"),
+    "dns": ("dns", "domain name system"),
+    "ssl": ("ssl", "tls", "https"),
+    "load_balancing": ("load balancing", "load balancer"),
+    "nginx": ("nginx", "nginx web server"),
+    "apache": ("apache", "apache http server"),
     
     # Design & UX
-    "ui_design": _norm(["ui", "user interface", "ui design"]),
-    "ux_design": _norm(["ux", "user experience", "ux design"]),
-    "figma": _norm(["figma"]),
-    "sketch": _norm(["sketch", "sketch app"]),
-    "adobe_xd": _norm(["adobe xd", "xd"]),
-    "photoshop": _norm(["photoshop", "adobe photoshop"]),
-    "illustrator": _norm(["illustrator", "adobe illustrator"]),
+    "ui_design": ("ui", "user interface", "ui design"),
+    "ux_design": ("ux", "user experience", "ux design"),
+    "figma": ("figma",),
+    "sketch": ("sketch", "sketch app"),
+    "adobe_xd": ("adobe xd", "xd"),
+    "photoshop": ("photoshop", "adobe photoshop"),
+    "illustrator": ("illustrator", "adobe illustrator"),
 }
 
 # Skill category mapping for broader matching
-SKILL_CATEGORIES: Dict[str, List[str]] = {
-    "frontend": ["javascript", "typescript", "html", "css", "react", "angular", "vue", "svelte", 
-                "jquery", "tailwind", "bootstrap", "material_ui", "vite", "webpack"],
-    "backend": ["python", "java", "csharp", "php", "ruby", "go", "nodejs", "django", "flask", 
-               "fastapi", "spring", "laravel", "rails", "aspnet"],
-    "database": ["postgresql", "mysql", "mongodb", "sqlite", "redis", "sql", "nosql", 
-                "supabase", "firebase"],
-    "devops": ["aws", "azure", "gcp", "vercel", "railway", "digitalocean", "docker", 
-              "kubernetes", "jenkins", "github_actions", "gitlab"],
-    "web_concepts": ["responsive_design", "web_accessibility", "cross_browser", "seo", 
-                    "web_performance", "web_security", "http", "websocket", "cdn", "ssl"],
-    "methodologies": ["oop", "functional_programming", "mvc", "microservices", "serverless", 
-                     "agile", "tdd", "bdd"],
-    "testing": ["jest", "mocha", "cypress", "pytest", "unit_testing", "integration_testing", "e2e_testing"],
-    "tools": ["git", "github", "gitlab_tool", "bitbucket", "vscode", "intellij", "webstorm", "postman"],
-    "apis": ["rest", "graphql", "grpc", "groq", "openai", "deepgram"],
-    "frontend": ["javascript", "typescript", "html", "css", "react", "angular", "vue", "svelte", 
-                "jquery", "tailwind", "bootstrap", "material_ui", "vite", "webpack"],
-    "backend": ["python", "java", "csharp", "php", "ruby", "go", "nodejs", "django", "flask", 
-               "fastapi", "spring", "laravel", "rails", "aspnet"],
-    "database": ["postgresql", "mysql", "mongodb", "sqlite", "redis", "sql", "nosql", 
-                "supabase", "firebase"],
-    "devops": ["aws", "azure", "gcp", "vercel", "railway", "digitalocean", "docker", 
-              "kubernetes", "jenkins", "github_actions", "gitlab"],
-    "web_concepts": ["responsive_design", "web_accessibility", "cross_browser", "seo", 
-                    "web_performance", "web_security", "http", "websocket", "cdn", "ssl"],
-    "methodologies": ["oop", "functional_programming", "mvc", "microservices", "serverless", 
-                     "agile", "tdd", "bdd"],
-    "testing": ["jest", "mocha", "cypress", "pytest", "unit_testing", "integration_testing", "e2e_testing"],
-    "tools": ["git", "github", "gitlab_tool", "bitbucket", "vscode", "intellij", "webstorm", "postman"],
-    "apis": ["rest", "graphql", "grpc", "groq", "openai", "deepgram"],
-
+_SKILL_CATEGORIES_SRC: Dict[str, Tuple[str, ...]] = {
+    "frontend": ("javascript", "typescript", "html", "css", "react", "angular", "vue", "svelte", 
+                "jquery", "tailwind", "bootstrap", "material_ui", "vite", "webpack"),
+    "backend": ("python", "java", "csharp", "php", "ruby", "go", "nodejs", "django", "flask", 
+               "fastapi", "spring", "laravel", "rails", "aspnet"),
+    "database": ("postgresql", "mysql", "mongodb", "sqlite", "redis", "sql", "nosql", 
+                "supabase", "firebase"),
+    "devops": ("aws", "azure", "gcp", "vercel", "railway", "digitalocean", "docker", 
+              "kubernetes", "jenkins", "github_actions", "gitlab"),
+    "web_concepts": ("responsive_design", "web_accessibility", "cross_browser", "seo", 
+                    "web_performance", "web_security", "http", "websocket", "cdn", "ssl"),
+    "methodologies": ("oop", "functional_programming", "mvc", "microservices", "serverless", 
+                     "agile", "tdd", "bdd"),
+    "testing": ("jest", "mocha", "cypress", "pytest", "unit_testing", "integration_testing", "e2e_testing"),
+    "tools": ("git", "github", "gitlab_tool", "bitbucket", "vscode", "intellij", "webstorm", "postman"),
+    "apis": ("rest", "graphql", "grpc", "groq", "openai", "deepgram"),
 }
 
+# Read-only views — the indexes and caches derived below can never go stale
+SKILL_SYNONYMS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {canonical: _norm(synonyms) for canonical, synonyms in _SKILL_SYNONYMS_SRC.items()}
+)
+SKILL_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType(_SKILL_CATEGORIES_SRC)
+
+
+def _build_synonym_index() -> Dict[str, Tuple[str, ...]]:
+    """
+    Every synonym and canonical key → all canonicals it belongs to ("https" → ("http", "ssl")).
+    Priority order: a canonical key maps to itself first, then canonicals in declaration order.
+    """
+    index: Dict[str, List[str]] = {canonical: [canonical] for canonical in SKILL_SYNONYMS}
+    for canonical, synonyms in SKILL_SYNONYMS.items():
+        for synonym in synonyms:
+            owners = index.setdefault(synonym, [])
+            if canonical not in owners:
+                owners.append(canonical)
+    return {synonym: tuple(owners) for synonym, owners in index.items()}
+
+
+def _build_category_index() -> Dict[str, str]:
+    """Every categorised skill → its first category."""
+    index: Dict[str, str] = {}
+    for category, skills in SKILL_CATEGORIES.items():
+        for skill in skills:
+            index.setdefault(skill, category)
+    return index
+
+
+# Reverse lookups built once at import — single hashed probes instead of scanning every list
+_SYNONYM_TO_CANONICALS: Dict[str, Tuple[str, ...]] = _build_synonym_index()
+_SYNONYM_TO_CANONICAL: Dict[str, str] = {synonym: owners[0] for synonym, owners in _SYNONYM_TO_CANONICALS.items()}
+_SKILL_TO_CATEGORY: Dict[str, str] = _build_category_index()
+
+
+def _collect_all_skills() -> Tuple[str, ...]:
+    # Every synonym, then the canonical keys as searchable tokens
+    return _norm(chain(chain.from_iterable(SKILL_SYNONYMS.values()), SKILL_SYNONYMS.keys()))
+
+
+# The dictionary never changes after import — flatten it once
+_ALL_SKILLS: Tuple[str, ...] = _collect_all_skills()
+ALL_SKILLS_SET: FrozenSet[str] = frozenset(_ALL_SKILLS)
+
 
 def get_all_skills() -> List[str]:
     """Return all unique skill tokens across all categories (lowercased)."""
-    collected: List[str] = []
-    for synonyms in SKILL_SYNONYMS.values():
-        collected.extend(synonyms)
-    # Include canonical keys as searchable tokens
-    collected.extend(skill for skill in SKILL_SYNONYMS.keys())
-    return _norm(collected)
+    return list(_ALL_SKILLS)
+
+
+def get_all_skills_set() -> FrozenSet[str]:
+    """
+    Same tokens as get_all_skills, as a frozenset — use this for `token in ...` checks
+    instead of scanning the list.
+    """
+    return ALL_SKILLS_SET
 
 
 def find_standard_skill(skill_text: str) -> Optional[str]:
@@ -217,33 +257,79 @@ def find_standard_skill(skill_text: str) -> Optional[str]:
     Map any token to its canonical skill key if found.
     Exact, case-insensitive match against the synonym lists or canonical keys.
     """
-    s = (skill_text or "").strip().lower()
-    if not s:
-        return None
-    # Direct match by canonical key
-    if s in SKILL_SYNONYMS:
-        return s
-    # Match in synonyms
-    for canonical, synonyms in SKILL_SYNONYMS.items():
-        if s in synonyms:
-            return canonical
-    return None
+    return _SYNONYM_TO_CANONICAL.get(skill_text.strip().lower()) if skill_text else None
+
+
+def find_standard_skill_fast(normalized: str) -> Optional[str]:
+    """find_standard_skill without normalisation — the caller must pass a stripped, lowercase token."""
+    return _SYNONYM_TO_CANONICAL.get(normalized)
+
+
+def find_standard_skills(skill_text: str) -> Tuple[str, ...]:
+    """
+    Every canonical key a token maps to, highest priority first (empty tuple if none).
+    find_standard_skill returns the first of these.
+    """
+    return _SYNONYM_TO_CANONICALS.get(skill_text.strip().lower(), ()) if skill_text else ()
+
+
+def find_standard_skills_batch(tokens: Iterable[str]) -> List[Optional[str]]:
+    """find_standard_skill for many tokens at once — one result per token, in order."""
+    lookup = _SYNONYM_TO_CANONICAL.get
+    return [lookup(t.strip().lower()) if t else None for t in tokens]
+
+
+@functools.lru_cache(maxsize=1)
+def _skill_scanner() -> KeywordScanner[Tuple[str, ...]]:
+    """Single-pass scanner over every synonym, built on first use. Values are all owning canonicals."""
+    return KeywordScanner(_SYNONYM_TO_CANONICALS)
+
+
+def extract_skills(text: str) -> List[str]:
+    """
+    Return the canonical key of every skill mentioned in free text, multi-word synonyms included
+    ("ruby on rails" → "rails"). Whole-word, case-insensitive, one pass over the text.
+    A synonym shared by several skills reports all of them, as find_standard_skills does
+    ("HTTPS" → "http", "ssl").
+    """
+    if not text:
+        return []
+    return list(dict.fromkeys(chain.from_iterable(_skill_scanner().scan(text))))
+
+
+def scan_skills(text: str) -> List[Tuple[int, int, str]]:
+    """
+    Like extract_skills, but reports every occurrence as (start, end, canonical), in text order —
+    for highlighting or context windows around each hit. Overlapping hits are all kept
+    ("Ruby on Rails" yields both "rails" and "ruby"), and a shared synonym yields one span per canonical.
+    """
+    if not text:
+        return []
+    return [
+        (start, end, canonical)
+        for start, end, owners in _skill_scanner().scan_spans(text)
+        for canonical in owners
+    ]
 
 
 def get_skill_synonyms(canonical: str) -> List[str]:
     """Return all synonyms for a canonical key (empty list if not found)."""
-    return SKILL_SYNONYMS.get((canonical or "").strip().lower(), [])
+    return list(SKILL_SYNONYMS.get((canonical or "").strip().lower(), ()))
+
+
+def get_skill_synonyms_fast(canonical_lower: str) -> Tuple[str, ...]:
+    """
+    get_skill_synonyms without normalisation or copying — the caller must pass a stripped,
+    lowercase key. Returns the shared immutable tuple (empty if not found).
+    """
+    return SKILL_SYNONYMS.get(canonical_lower, ())
 
 
 def get_skill_category(canonical: str) -> Optional[str]:
     """Return the category of a skill, or None if not found."""
-    canonical = (canonical or "").strip().lower()
-    for category, skills in SKILL_CATEGORIES.items():
-        if canonical in skills:
-            return category
-    return None
+    return _SKILL_TO_CATEGORY.get((canonical or "").strip().lower())
 
 
 def get_skills_in_category(category: str) -> List[str]:
     """Return all skills in a given category."""
-    return SKILL_CATEGORIES.get((category or "").strip().lower(), [])
\ No newline at end of file
+    return list(SKILL_CATEGORIES.get((category or "").strip().lower(), ()))
\ No newline at end of file